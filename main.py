@@ -1,11 +1,25 @@
+import os
 import time
-import random
-import copy
 import io
 import base64
+import asyncio
+import threading
+import heapq
+import hashlib
+import pickle
+import multiprocessing
+import queue
+from collections import OrderedDict, deque
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+from numba import njit
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from functools import partial
 from typing import List, Dict, Optional
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,7 +30,31 @@ import uvicorn
 # APP SETUP
 # ============================================================================
 
-app = FastAPI(title="Job Scheduling API", version="16.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One evaluation pool for the server's lifetime: worker start-up and the
+    # Numba warm-up are paid once instead of on every request. The
+    # backtracking kernel runs in this process, and so does simulate() when
+    # decoding a schedule or evaluating without the pool, so warm both here
+    _init_placement()
+    _init_worker()
+    # Under several uvicorn workers (WEB_CONCURRENCY) each one gets its
+    # share of the cores rather than a full-size pool
+    pool_size = max(1, (os.cpu_count() or 1) // int(os.environ.get("WEB_CONCURRENCY", 1)))
+    app.state.pool = ProcessPoolExecutor(max_workers=pool_size, initializer=_init_worker)
+    app.state.pool_size = pool_size
+    # The island model's migration ring lives in one manager process for the
+    # server's lifetime too. There is a single ring, so island solves take
+    # turns with it instead of queueing their islands behind each other
+    with multiprocessing.Manager() as manager:
+        app.state.rings = queue.Queue()
+        app.state.rings.put([manager.Queue() for _ in range(pool_size)])
+        try:
+            yield
+        finally:
+            app.state.pool.shutdown()
+
+app = FastAPI(title="Job Scheduling API", version="16.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -26,6 +64,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# One figure/canvas pair reused for every performance plot instead of
+# creating a pyplot figure per request
+_PLOT_FIGURE = Figure(figsize=(12, 6))
+FigureCanvasAgg(_PLOT_FIGURE)
+_PLOT_LOCK = threading.Lock()
+
 # ============================================================================
 # MODELS
 # ============================================================================
@@ -37,6 +81,19 @@ class Job(BaseModel):
     dependencies: List[int] = []
     min_chunk_size: int = 1
 
+class _JobInt:
+    """Slim internal copy of a Job for the solvers' inner loops.
+
+    Plain __slots__ attributes avoid Pydantic attribute access; the Job
+    models themselves are only used when building the response.
+    """
+    __slots__ = ('id', 'duration', 'dep_ids')
+
+    def __init__(self, job):
+        self.id = job.id
+        self.duration = job.duration
+        self.dep_ids = tuple(job.dependencies)
+
 class ScheduleRequest(BaseModel):
     jobs: List[Job]
     algorithm: str = "backtracking"
@@ -77,45 +134,155 @@ NUM_MACHINES = 3
 MAX_CHUNK_SIZE = 5
 TOTAL_CAPACITY = FIXED_MACHINE_CAPACITY * NUM_MACHINES
 
+# Island model: sub-populations exchange their best chromosomes every
+# MIGRATION_INTERVAL generations with their ring neighbour
+MIN_ISLAND_SIZE = 10
+MIGRATION_INTERVAL = 10
+MIGRANTS = 3
+
+# Solved requests kept per server process, least recently used evicted
+RESULT_CACHE_SIZE = 128
+
+# ============================================================================
+# FITNESS EVALUATION (runs in worker processes)
+# ============================================================================
+
+@njit(cache=True)
+def simulate(chunk_job, chunk_mach, chunk_size, job_start, job_cnt, job_dur,
+             dep_indptr, dep_nodes, num_machines, capacity,
+             m_times, machine_work, completed, chunk_start):
+    """Run the chunk schedule for one chromosome and score it.
+
+    Chunk arrays are laid out by (topological index, chunk order); job and
+    dependency arrays are indexed by topological position. m_times,
+    machine_work, completed and chunk_start are caller-owned scratch buffers
+    that are reset here. Returns (fitness, chunk_start) where fitness is the
+    penalised makespan, or inf when the chromosome does not cover every job
+    exactly. Makespan, total work and per-machine load are accumulated in the
+    same pass.
+    """
+    num_jobs = job_start.shape[0]
+    m_times[:] = 0
+    machine_work[:] = 0
+    completed[:] = 0
+    chunk_start[:] = 0
+    violations_count = 0
+    makespan = 0
+    total_work = 0
+    
+    for j in range(num_jobs):
+        first = job_start[j]
+        count = job_cnt[j]
+        if count == 0:
+            return np.inf, chunk_start
+        
+        # Latest completion among this job's dependencies: a contiguous CSR slice
+        current_time = 0
+        for d in range(dep_indptr[j], dep_indptr[j + 1]):
+            dep_end = completed[dep_nodes[d]]
+            if dep_end > current_time:
+                current_time = dep_end
+        
+        total_size = 0
+        for c in range(first, first + count):
+            machine = chunk_mach[c]
+            size = chunk_size[c]
+            total_size += size
+            
+            chunk_begin = current_time if current_time > m_times[machine] else m_times[machine]
+            chunk_end = chunk_begin + size
+            if chunk_end > capacity:
+                violations_count += 1
+            if chunk_end > makespan:
+                makespan = chunk_end
+            
+            chunk_start[c] = chunk_begin
+            m_times[machine] = chunk_end
+            machine_work[machine] += size
+            current_time = chunk_end
+        
+        if total_size != job_dur[j]:
+            return np.inf, chunk_start
+        total_work += total_size
+        completed[j] = current_time
+    
+    # Penalty for capacity violations
+    violation_penalty = violations_count * 10
+    
+    total_machine_time = makespan * num_machines
+    efficiency = total_work / total_machine_time if total_machine_time > 0 else 0.0
+    penalty = (1 - efficiency) * makespan * 0.4
+    
+    util_min = np.inf
+    util_max = -np.inf
+    for m in range(num_machines):
+        utilization = machine_work[m] / max(1, m_times[m])
+        util_min = min(util_min, utilization)
+        util_max = max(util_max, utilization)
+    load_balance_penalty = (util_max - util_min) * makespan * 0.2
+    
+    return makespan + penalty + load_balance_penalty + violation_penalty, chunk_start
+
+
+def _scratch_buffers(num_machines, num_jobs, num_chunks):
+    """simulate()'s m_times, machine_work, completed and chunk_start buffers."""
+    return (np.zeros(num_machines, np.int64), np.zeros(num_machines, np.int64),
+            np.zeros(num_jobs, np.int64), np.zeros(num_chunks, np.int64))
+
+
+def _fitness(machines, layout, buffers, num_machines, capacity):
+    """Return the penalised makespan of one chromosome.
+
+    layout is the per-solve tuple (chunk_job, chunk_sizes, job_start,
+    job_cnt, job_dur, dep_indptr, dep_nodes) built by
+    CulturalAlgorithm._build_layout and buffers the matching simulate()
+    scratch arrays.
+    """
+    chunk_job, chunk_sizes, *job_arrays = layout
+    fitness, _ = simulate(chunk_job, machines, chunk_sizes, *job_arrays, num_machines, capacity, *buffers)
+    return fitness
+
+
+def _init_worker():
+    """Pool initializer: load (or compile) simulate() before the first task."""
+    i8 = np.zeros(1, np.int8)
+    i32 = np.zeros(1, np.int32)
+    i64 = np.zeros(1, np.int64)
+    simulate(i32, i8, i8, i32, i32, i32, np.zeros(2, np.int32), np.zeros(0, np.int32),
+             1, 1, i64, i64, i64, i64)
+
 # ============================================================================
 # BELIEF SPACE
 # ============================================================================
 
 class BeliefSpace:
-    def __init__(self, num_machines):
+    def __init__(self, num_machines, num_jobs):
         self.num_machines = num_machines
         self.global_best_chromosome = None
         self.global_best_fitness = float('inf')
-        self.global_best_schedule = None
-        self.machine_reputation = {} 
-        self.capacity_violations_history = []
+        # reputation[job_idx, machine]: how often accepted individuals put a
+        # chunk of that job (by topological index) on that machine
+        self.reputation = np.zeros((num_jobs, num_machines), np.int32)
 
-    def update(self, population_fitness_list):
-        sorted_pop = sorted(population_fitness_list, key=lambda x: x[0])
-        acceptance_count = max(1, len(sorted_pop) // 5)
-        accepted_individuals = sorted_pop[:acceptance_count]
+    def update(self, population_fitness_list, chunk_job):
+        acceptance_count = max(1, len(population_fitness_list) // 5)
+        accepted_individuals = heapq.nsmallest(acceptance_count, population_fitness_list, key=lambda x: x[0])
         
         current_best = accepted_individuals[0]
         if current_best[0] < self.global_best_fitness:
             self.global_best_fitness = current_best[0]
-            self.global_best_chromosome = copy.deepcopy(current_best[1])
-            self.global_best_schedule = current_best[2]
-            self.capacity_violations_history = current_best[3]
+            # Chromosomes are never modified in place (_mutate and _crossover build
+            # new arrays), so keeping a reference is safe
+            self.global_best_chromosome = current_best[1]
             
-        for _, chromosome, _, _ in accepted_individuals:
-            for job_id, chunks in chromosome.items():
-                if job_id not in self.machine_reputation:
-                    self.machine_reputation[job_id] = {}
-                for chunk in chunks:
-                    m_id = chunk['machine']
-                    self.machine_reputation[job_id][m_id] = \
-                        self.machine_reputation[job_id].get(m_id, 0) + 1
-
-    def influence_mutation(self, job_id):
-        if job_id in self.machine_reputation and random.random() < 0.7:
-            scores = self.machine_reputation[job_id]
-            if scores:
-                return max(scores, key=scores.get)
+        machines = np.stack([chromosome for _, chromosome in accepted_individuals])
+        job_idxs = np.broadcast_to(chunk_job, machines.shape)
+        np.add.at(self.reputation, (job_idxs, machines), 1)
+
+    def influence_mutation(self, job_idx, draw):
+        scores = self.reputation[job_idx]
+        if draw < 0.7 and scores.any():
+            return int(np.argmax(scores))
         return None
 
 # ============================================================================
@@ -128,11 +295,14 @@ class CulturalAlgorithm:
         self.num_machines = NUM_MACHINES
         self.machine_capacity = FIXED_MACHINE_CAPACITY  # Always 40
         self.job_dict = {job.id: job for job in jobs}
+        self._jobs_int = [_JobInt(job) for job in jobs]
         self.population_size = 60
         self.generations = 100
         self.mutation_rate = 0.5
         self.elite_size = 8
-        self.belief_space = BeliefSpace(self.num_machines)
+        self.num_islands = 1  # set per solve from the evaluation workers available
+        self.belief_space = BeliefSpace(self.num_machines, len(self.job_dict))
+        self.rng = np.random.default_rng()
         self.logs = []
         self.history = []
         self.start_time = time.time()
@@ -140,8 +310,15 @@ class CulturalAlgorithm:
         self.MAX_CHUNK_SIZE = MAX_CHUNK_SIZE
         self.capacity_violations = []
         self.has_capacity_error = False
+        # Chunk sizes are deterministic per job; only machine assignments evolve
+        self._split_sizes: Dict[int, List[int]] = {job.id: self._compute_split_sizes(job) for job in jobs}
 
-    def solve(self):
+    def solve(self, executor=None, workers=None, rings=None):
+        """Run the algorithm. executor is a process pool to evaluate on and
+        workers its process count (read from the pool when omitted); a pool
+        is created for this call when executor is omitted. rings is a queue.Queue holding the reusable list of manager
+        queues for island migration; a manager is started per solve when
+        omitted."""
         self.logs.append("🧬 Starting Cultural Algorithm...")
         self.logs.append(f"📊 Total jobs: {len(self.jobs)}")
         self.logs.append(f"📊 Total work: {self.total_work} units")
@@ -168,50 +345,26 @@ class CulturalAlgorithm:
         topological_order = self._topological_sort()
         if not topological_order:
             return self._create_error_result("Cyclic dependencies detected!")
+        if any(dep_id not in self.job_dict for job in self.jobs for dep_id in job.dependencies):
+            return self._create_error_result("No valid solution found")
 
-        population = []
-        for _ in range(self.population_size):
-            chrom = self._create_smart_chromosome(topological_order)
-            population.append(chrom)
-            
-        for generation in range(self.generations):
-            fitness_scores = []
-            for chromosome in population:
-                fitness, schedule, violations = self._evaluate_chromosome(chromosome, topological_order)
-                if fitness < float('inf'):
-                    fitness_scores.append((fitness, chromosome, schedule, violations))
-            
-            if not fitness_scores:
-                continue
-                
-            self.belief_space.update(fitness_scores)
-            self.history.append(self.belief_space.global_best_fitness)
-            
-            parents = self._select_parents(fitness_scores)
-            new_population = []
-            
-            sorted_fitness = sorted(fitness_scores, key=lambda x: x[0])
-            for i in range(min(self.elite_size, len(sorted_fitness))):
-                new_population.append(copy.deepcopy(sorted_fitness[i][1]))
-            
-            while len(new_population) < self.population_size:
-                p1 = random.choice(parents)
-                p2 = random.choice(parents)
-                child = self._crossover(p1, p2, topological_order) if random.random() < 0.9 else copy.deepcopy(p1)
-                
-                if random.random() < self.mutation_rate:
-                    child = self._mutate(child, topological_order)
-                new_population.append(child)
-            
-            population = new_population
+        self._build_layout(topological_order)
+        
+        if executor is None and (os.cpu_count() or 1) > 1:
+            workers = os.cpu_count()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                self._evolve(executor, topological_order, workers, rings)
+        else:
+            if executor is not None and workers is None:
+                workers = executor._max_workers
+            self._evolve(executor, topological_order, workers or 1, rings)
 
         execution_time = time.time() - self.start_time
         best_makespan = self.belief_space.global_best_fitness
-        best_schedule = self.belief_space.global_best_schedule
-        self.capacity_violations = self.belief_space.capacity_violations_history
+        best_chromosome = self.belief_space.global_best_chromosome
         
-        if best_schedule and best_makespan < float('inf'):
-            plot_base64 = self._generate_plot()
+        if best_chromosome is not None and best_makespan < float('inf'):
+            best_schedule, self.capacity_violations = self._decode_schedule(best_chromosome, topological_order)
             eff, idle, tm, machine_loads = self._calculate_performance_stats(best_schedule, best_makespan)
             final_schedule = self._build_final_schedule(best_schedule)
             splits = self._calculate_splits_info(best_schedule)
@@ -224,31 +377,171 @@ class CulturalAlgorithm:
                 success=True, makespan=best_makespan, execution_time=execution_time,
                 schedule=final_schedule, logs=self.logs, splits_info=splits,
                 efficiency=eff, total_work=self.total_work, total_idle_time=idle,
-                total_machine_time=tm, performance_plot=plot_base64,
+                total_machine_time=tm,
                 capacity_violations=self.capacity_violations,
                 machine_loads=machine_loads,
                 performance_details={
                     "generations": self.generations, 
                     "population": self.population_size,
+                    "islands": self.num_islands,
                     "machine_capacity": self.machine_capacity
                 }
             )
         return self._create_error_result("No valid solution found")
 
+    def _evolve(self, executor, topological_order, workers, rings):
+        # One island per worker process that will actually run it. Without
+        # at least two islands there is nothing to parallelise, so the single
+        # population is evaluated in this process
+        self.num_islands = 1
+        if executor is not None:
+            self.num_islands = max(1, min(workers, self.population_size // MIN_ISLAND_SIZE))
+        if self.num_islands > 1:
+            self.logs.append(f"🏝️ Island model: {self.num_islands} islands × "
+                             f"{self.population_size // self.num_islands} individuals")
+            self._solve_islands(executor, rings)
+        else:
+            self._solve_single_population(topological_order)
+
+    def _solve_single_population(self, topological_order):
+        # One population evolved and evaluated in this process.
+        population = []
+        for _ in range(self.population_size):
+            chrom = self._create_smart_chromosome(topological_order)
+            population.append(chrom)
+            
+        evaluate = self._evaluator()
+        for generation in range(self.generations):
+            fitnesses = [evaluate(chromosome) for chromosome in population]
+            population = self._next_generation(population, fitnesses, topological_order)
+
+    def _solve_islands(self, executor, rings):
+        # Each island evolves in its own worker; migrants travel around a ring
+        # of manager queues so islands never wait on each other.
+        if rings is None:
+            with multiprocessing.Manager() as manager:
+                results = self._run_islands(executor, [manager.Queue() for _ in range(self.num_islands)])
+        else:
+            ring = rings.get()
+            try:
+                # Drop migrants a previous solve sent but never collected
+                for inbox in ring:
+                    while not inbox.empty():
+                        inbox.get_nowait()
+                results = self._run_islands(executor, ring[:self.num_islands])
+            finally:
+                rings.put(ring)
+        
+        histories = []
+        for best_fitness, best_chromosome, history in results:
+            if best_fitness < self.belief_space.global_best_fitness:
+                self.belief_space.global_best_fitness = best_fitness
+                self.belief_space.global_best_chromosome = best_chromosome
+            histories.append(history)
+        self.history = [min(values) for values in zip(*histories)]
+
+    def _run_islands(self, executor, queues):
+        island_size = self.population_size // self.num_islands
+        seeds = self.rng.integers(0, 2**32, size=self.num_islands)
+        futures = [
+            executor.submit(
+                _run_island, self.jobs, island_size, max(1, self.elite_size // self.num_islands),
+                self.generations, queues[i], queues[(i + 1) % self.num_islands],
+                int(seeds[i])
+            )
+            for i in range(self.num_islands)
+        ]
+        return [future.result() for future in futures]
+
+    def _next_generation(self, population, fitnesses, topological_order):
+        fitness_scores = []
+        for chromosome, fitness in zip(population, fitnesses):
+            if fitness < float('inf'):
+                fitness_scores.append((fitness, chromosome))
+        
+        if not fitness_scores:
+            return population
+            
+        self.belief_space.update(fitness_scores, self._chunk_job)
+        self.history.append(self.belief_space.global_best_fitness)
+        
+        parents = self._select_parents(fitness_scores)
+        new_population = []
+        
+        elites = heapq.nsmallest(self.elite_size, fitness_scores, key=lambda x: x[0])
+        for _, chromosome in elites:
+            new_population.append(chromosome.copy())
+        
+        # Draw this generation's randomness up front in a few batched calls
+        n_children = self.population_size - len(new_population)
+        mates = self.rng.integers(0, len(parents), size=(n_children, 2))
+        cx_draws = self.rng.random(n_children)
+        mut_draws = self.rng.random((n_children, 5))
+        machine_draws = self.rng.permuted(
+            np.tile(np.arange(self.num_machines, dtype=np.int8), (n_children, 1)), axis=1)
+        
+        # Crossover for the whole generation in one np.where; children that
+        # skip crossover take every job from their first parent
+        job_masks = self.rng.random((n_children, len(self._job_cnt))) < 0.5
+        job_masks[cx_draws >= 0.9] = True
+        parent_pool = np.stack(parents)
+        children = self._crossover(parent_pool[mates[:, 0]], parent_pool[mates[:, 1]], job_masks)
+        
+        for k in range(n_children):
+            child = children[k]
+            if mut_draws[k, 0] < self.mutation_rate:
+                child = self._mutate(child, topological_order, mut_draws[k, 1:], machine_draws[k])
+            new_population.append(child)
+        
+        return new_population
+
+    def _build_layout(self, topological_order):
+        """Fix the chunk layout and dependency arrays shared by every chromosome.
+
+        Chunk sizes only depend on job.duration and MAX_CHUNK_SIZE, so a
+        chromosome reduces to one machine index per chunk, laid out in
+        topological order. Dependencies are stored CSR-style as topological
+        positions so the simulation never touches Job objects or dicts.
+        """
+        topo_index = {job.id: t for t, job in enumerate(topological_order)}
+        sizes = []
+        job_cnt = []
+        dep_indptr = [0]
+        dep_nodes = []
+        self._job_slices = {}
+        for job in topological_order:
+            job_sizes = self._split_sizes[job.id]
+            self._job_slices[job.id] = slice(len(sizes), len(sizes) + len(job_sizes))
+            sizes.extend(job_sizes)
+            job_cnt.append(len(job_sizes))
+            dep_nodes.extend(topo_index[dep_id] for dep_id in job.dep_ids)
+            dep_indptr.append(len(dep_nodes))
+        
+        self._chunk_sizes = np.array(sizes, np.int8)
+        self._job_cnt = np.array(job_cnt, np.int32)
+        self._job_start = np.zeros(len(job_cnt), np.int32)
+        self._job_start[1:] = np.cumsum(self._job_cnt)[:-1]
+        self._job_dur = np.array([job.duration for job in topological_order], np.int32)
+        self._chunk_job = np.repeat(np.arange(len(job_cnt), dtype=np.int32), self._job_cnt)
+        self._dep_indptr = np.array(dep_indptr, np.int32)
+        self._dep_nodes = np.array(dep_nodes, np.int32)
+        self._layout = (self._chunk_job, self._chunk_sizes, self._job_start, self._job_cnt,
+                        self._job_dur, self._dep_indptr, self._dep_nodes)
+        # Scratch space reused by every simulate() call instead of allocating per evaluation
+        self._buffers = _scratch_buffers(self.num_machines, len(job_cnt), len(sizes))
+
     def _create_smart_chromosome(self, topological_order):
-        chrom = {}
+        chrom = self.rng.integers(0, self.num_machines, size=len(self._chunk_sizes), dtype=np.int8)
         for job in topological_order:
-            if job.duration <= self.MAX_CHUNK_SIZE:
-                chrom[job.id] = [{
-                    'machine': random.randint(0, self.num_machines - 1),
-                    'size': job.duration,
-                    'order': 0
-                }]
-            else:
-                chrom[job.id] = self._create_intelligent_split(job)
+            if job.duration > self.MAX_CHUNK_SIZE:
+                machines = self.rng.permutation(self.num_machines)
+                chrom[self._job_slices[job.id]] = self._create_intelligent_split(job, machines)
         return chrom
 
-    def _create_intelligent_split(self, job):
+    def _compute_split_sizes(self, job):
+        if job.duration <= self.MAX_CHUNK_SIZE:
+            return [job.duration]
+        
         num_chunks = (job.duration + self.MAX_CHUNK_SIZE - 1) // self.MAX_CHUNK_SIZE
         base = job.duration // num_chunks
         remainder = job.duration % num_chunks
@@ -275,122 +568,86 @@ class CulturalAlgorithm:
             else:
                 final_sizes.append(size)
         
-        num_final_chunks = len(final_sizes)
-        machines = list(range(self.num_machines))
-        random.shuffle(machines)
-        
-        chunks = []
-        for i in range(num_final_chunks):
-            chunks.append({
-                'machine': machines[i % self.num_machines],
-                'size': final_sizes[i],
-                'order': i
-            })
-        
-        total = sum(c['size'] for c in chunks)
-        assert total == job.duration, f"Split error: {total} != {job.duration}"
-        
-        return chunks
+        assert sum(final_sizes) == job.duration, f"Split error: {sum(final_sizes)} != {job.duration}"
+        return final_sizes
+
+    def _create_intelligent_split(self, job, machines):
+        """Spread a split job's chunks round-robin over a shuffled machine order."""
+        return np.resize(machines, len(self._split_sizes[job.id]))
 
-    def _mutate(self, chromosome, topological_order):
-        mutated = copy.deepcopy(chromosome)
+    def _mutate(self, chromosome, topological_order, draws, machines):
+        """Mutate a copy of chromosome.
+
+        draws holds four uniform [0, 1) numbers (job, mutation type, chunk,
+        belief influence) and machines a random permutation of machine ids.
+        """
+        mutated = chromosome.copy()
         if not topological_order: 
             return mutated
         
-        job = random.choice(topological_order)
-        if job.id not in mutated: 
-            return mutated
-        
-        mutation_type = random.random()
+        job_draw, mutation_type, chunk_draw, influence_draw = draws
+        job = topological_order[int(job_draw * len(topological_order))]
+        span = self._job_slices[job.id]
         
         if job.duration > self.MAX_CHUNK_SIZE:
             if mutation_type < 0.5:
-                mutated[job.id] = self._create_intelligent_split(job)
+                mutated[span] = self._create_intelligent_split(job, machines)
             else:
-                if mutated[job.id]:
-                    chunk_idx = random.randint(0, len(mutated[job.id]) - 1)
-                    mutated[job.id][chunk_idx]['machine'] = random.randint(0, self.num_machines - 1)
+                chunk_idx = span.start + int(chunk_draw * (span.stop - span.start))
+                mutated[chunk_idx] = machines[0]
         else:
-            influenced = self.belief_space.influence_mutation(job.id)
+            influenced = self.belief_space.influence_mutation(self._chunk_job[span.start], influence_draw)
             if influenced is not None:
-                mutated[job.id][0]['machine'] = influenced
+                mutated[span.start] = influenced
             else:
-                mutated[job.id][0]['machine'] = random.randint(0, self.num_machines - 1)
+                mutated[span.start] = machines[0]
         
         return mutated
 
-    def _evaluate_chromosome(self, chrom, order):
-        for job_id, chunks in chrom.items():
-            total_size = sum(chunk['size'] for chunk in chunks)
-            if total_size != self.job_dict[job_id].duration:
-                return float('inf'), [], []
-            for chunk in chunks:
-                if chunk['size'] > self.MAX_CHUNK_SIZE:
-                    return float('inf'), [], []
+    def _evaluator(self):
+        """Fitness function over this solve's layout and buffers."""
+        return partial(
+            _fitness,
+            layout=self._layout,
+            buffers=self._buffers,
+            num_machines=self.num_machines,
+            capacity=self.machine_capacity
+        )
+
+    def _decode_schedule(self, chrom, order):
+        """Rebuild the per-machine (job, start, end, size) schedule and the
+        capacity violations for a chromosome."""
+        chunk_job, chunk_size, *job_arrays = self._layout
+        chunk_mach = chrom
+        _, chunk_start = simulate(
+            chunk_job, chunk_mach, chunk_size, *job_arrays, self.num_machines, self.machine_capacity,
+            *self._buffers)
+        if __debug__:
+            # The layout already is (topological index, chunk order), so each
+            # job's chunks come out back-to-back in time without sorting
+            same_job = chunk_job[1:] == chunk_job[:-1]
+            assert np.all(chunk_start[1:][same_job] >= (chunk_start + chunk_size)[:-1][same_job])
         
-        m_times = [0] * self.num_machines
         m_scheds = [[] for _ in range(self.num_machines)]
-        completed = {}
         violations = []
-        machine_loads = [0] * self.num_machines
-        
-        for job in order:
-            start_time = 0
-            for dep_id in job.dependencies:
-                if dep_id in completed:
-                    start_time = max(start_time, completed[dep_id])
-                else:
-                    return float('inf'), [], []
-            
-            chunks = chrom.get(job.id, [])
-            if not chunks:
-                return float('inf'), [], []
-            
-            chunks = sorted(chunks, key=lambda x: x['order'])
-            current_time = start_time
-            
-            for chunk in chunks:
-                machine = chunk['machine']
-                size = chunk['size']
-                
-                chunk_start = max(current_time, m_times[machine])
-                chunk_end = chunk_start + size
-                
-                # Check for capacity violations (for visualization only)
-                if chunk_end > self.machine_capacity:
-                    violations.append({
-                        'job_id': job.id,
-                        'job_name': job.name,
-                        'machine': machine,
-                        'chunk_size': size,
-                        'exceeded_by': chunk_end - self.machine_capacity,
-                        'start': chunk_start,
-                        'end': chunk_end
-                    })
-                
-                m_times[machine] = chunk_end
-                machine_loads[machine] += size
-                m_scheds[machine].append((job, chunk_start, chunk_end, size))
-                current_time = chunk_end
-            
-            completed[job.id] = current_time
-        
-        makespan = max(m_times)
-        
-        # Penalty for capacity violations
-        violation_penalty = len(violations) * 10
-        
-        total_machine_time = makespan * self.num_machines
-        total_work = sum(sum(size for _, _, _, size in sched) for sched in m_scheds)
-        efficiency = total_work / total_machine_time if total_machine_time > 0 else 0
-        
-        penalty = (1 - efficiency) * makespan * 0.4
-        machine_utilization = [sum(size for _, _, _, size in m_sched) / max(1, m_times[m]) 
-                          for m, m_sched in enumerate(m_scheds)]
-        load_balance_penalty = (max(machine_utilization) - min(machine_utilization)) * makespan * 0.2
-        adjusted_makespan = makespan + penalty + load_balance_penalty + violation_penalty
-        
-        return adjusted_makespan, m_scheds, violations
+        for c in range(len(chunk_job)):
+            job = self.job_dict[order[chunk_job[c]].id]
+            machine = int(chunk_mach[c])
+            size = int(chunk_size[c])
+            start = int(chunk_start[c])
+            end = start + size
+            if end > self.machine_capacity:
+                violations.append({
+                    'job_id': job.id,
+                    'job_name': job.name,
+                    'machine': machine,
+                    'chunk_size': size,
+                    'exceeded_by': end - self.machine_capacity,
+                    'start': start,
+                    'end': end
+                })
+            m_scheds[machine].append((job, start, end, size))
+        return m_scheds, violations
 
     def _analyze_schedule(self, schedule, makespan):
         self.logs.append("\n📈 ===== SCHEDULE ANALYSIS =====")
@@ -421,61 +678,58 @@ class CulturalAlgorithm:
                 self.logs.append(f"    Exceeded capacity by {violation['exceeded_by']} units")
 
     def _generate_plot(self):
+        # Renders into the shared module-level figure; safe to call from a
+        # worker thread while the event loop keeps serving requests.
         try:
-            plt.figure(figsize=(12, 6))
-            plt.subplot(1, 2, 1)
-            plt.plot(self.history, label='Best Makespan', color='blue', linewidth=2)
-            plt.title('Cultural Algorithm Performance', fontsize=14, fontweight='bold')
-            plt.xlabel('Generation', fontsize=12)
-            plt.ylabel('Makespan', fontsize=12)
-            plt.grid(True, alpha=0.3)
-            plt.legend()
-            
-            plt.subplot(1, 2, 2)
-            # Draw capacity line
-            plt.axhline(y=FIXED_MACHINE_CAPACITY, color='red', linestyle='--', label=f'Capacity: {FIXED_MACHINE_CAPACITY}')
-            
-            if self.capacity_violations:
-                warnings_count = min(len(self.history), len(self.capacity_violations))
-                if warnings_count > 0:
-                    warnings_data = [1] * warnings_count  # Simplified
-                    plt.plot(warnings_data, label='Capacity Warnings', color='orange', linewidth=2)
-            
-            plt.title('Capacity Monitoring', fontsize=14, fontweight='bold')
-            plt.xlabel('Generation', fontsize=12)
-            plt.ylabel('Units', fontsize=12)
-            plt.grid(True, alpha=0.3)
-            plt.legend()
-            
-            plt.tight_layout()
-            buf = io.BytesIO()
-            plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
+            with _PLOT_LOCK:
+                fig = _PLOT_FIGURE
+                fig.clf()
+                ax = fig.add_subplot(1, 2, 1)
+                ax.plot(self.history, label='Best Makespan', color='blue', linewidth=2)
+                ax.set_title('Cultural Algorithm Performance', fontsize=14, fontweight='bold')
+                ax.set_xlabel('Generation', fontsize=12)
+                ax.set_ylabel('Makespan', fontsize=12)
+                ax.grid(True, alpha=0.3)
+                ax.legend()
+                
+                ax = fig.add_subplot(1, 2, 2)
+                # Draw capacity line
+                ax.axhline(y=FIXED_MACHINE_CAPACITY, color='red', linestyle='--', label=f'Capacity: {FIXED_MACHINE_CAPACITY}')
+                
+                if self.capacity_violations:
+                    warnings_count = min(len(self.history), len(self.capacity_violations))
+                    if warnings_count > 0:
+                        warnings_data = [1] * warnings_count  # Simplified
+                        ax.plot(warnings_data, label='Capacity Warnings', color='orange', linewidth=2)
+                
+                ax.set_title('Capacity Monitoring', fontsize=14, fontweight='bold')
+                ax.set_xlabel('Generation', fontsize=12)
+                ax.set_ylabel('Units', fontsize=12)
+                ax.grid(True, alpha=0.3)
+                ax.legend()
+                
+                fig.tight_layout()
+                buf = io.BytesIO()
+                fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
             buf.seek(0)
             img_str = base64.b64encode(buf.read()).decode('utf-8')
-            plt.close()
             return img_str
         except Exception as e:
             print(f"Error generating plot: {e}")
             return None
 
     def _select_parents(self, fitness_scores):
-        parents = []
-        for _ in range(len(fitness_scores)):
-            tournament = random.sample(fitness_scores, min(5, len(fitness_scores)))
-            best = min(tournament, key=lambda x: x[0])
-            parents.append(best[1])
-        return parents
-
-    def _crossover(self, p1, p2, order):
-        child = {}
-        for job in order:
-            if random.random() < 0.5:
-                if job.id in p1:
-                    child[job.id] = copy.deepcopy(p1[job.id])
-            else:
-                if job.id in p2:
-                    child[job.id] = copy.deepcopy(p2[job.id])
-        return child
+        # All tournaments at once: one row of contestant indices per parent slot
+        n = len(fitness_scores)
+        fitness = np.fromiter((s[0] for s in fitness_scores), dtype=np.float64, count=n)
+        idx = self.rng.integers(0, n, size=(n, min(5, n)))
+        winners = idx[np.arange(n), np.argmin(fitness[idx], axis=1)]
+        return [fitness_scores[i][1] for i in winners]
+
+    def _crossover(self, p1, p2, job_masks):
+        # Uniform crossover at job granularity: a job keeps all its chunks from
+        # one parent. Works row-wise on stacked parents as well.
+        return np.where(np.repeat(job_masks, self._job_cnt, axis=-1), p1, p2)
 
     def _calculate_performance_stats(self, schedule, makespan):
         total_machine_time = makespan * self.num_machines
@@ -539,36 +793,28 @@ class CulturalAlgorithm:
         return final
 
     def _topological_sort(self):
-        visited = set()
-        temp = set()
+        # Kahn's algorithm; dependencies on unknown ids are ignored here
+        jobs = list({job.id: job for job in self._jobs_int}.values())
+        in_degree = {job.id: 0 for job in jobs}
+        dependents = {job.id: [] for job in jobs}
+        for job in jobs:
+            for dep_id in job.dep_ids:
+                if dep_id in dependents:
+                    dependents[dep_id].append(job)
+                    in_degree[job.id] += 1
+        
+        ready = deque(job for job in jobs if in_degree[job.id] == 0)
         result = []
-        
-        def dfs(job_id):
-            if job_id in temp:
-                return False
-            if job_id in visited:
-                return True
-            
-            temp.add(job_id)
-            
-            job = self.job_dict.get(job_id)
-            if not job:
-                return True
-            
-            for dep_id in job.dependencies:
-                if not dfs(dep_id):
-                    return False
-            
-            temp.remove(job_id)
-            visited.add(job_id)
+        while ready:
+            job = ready.popleft()
             result.append(job)
-            return True
-        
-        for job in self.jobs:
-            if job.id not in visited:
-                if not dfs(job.id):
-                    return None
+            for dependent in dependents[job.id]:
+                in_degree[dependent.id] -= 1
+                if in_degree[dependent.id] == 0:
+                    ready.append(dependent)
         
+        if len(result) != len(jobs):
+            return None
         return result
 
     def _create_error_result(self, msg):
@@ -590,10 +836,220 @@ class CulturalAlgorithm:
             error_message=msg
         )
 
+# ============================================================================
+# ISLAND MODEL (runs in worker processes)
+# ============================================================================
+
+def _run_island(jobs, population_size, elite_size, generations, inbox, outbox, seed):
+    """Evolve one sub-population and return (best_fitness, best_chromosome, history).
+
+    Every MIGRATION_INTERVAL generations the island's best MIGRANTS go to
+    outbox and whatever has arrived in inbox replaces its worst individuals.
+    """
+    ca = CulturalAlgorithm(jobs)
+    ca.rng = np.random.default_rng(seed)
+    ca.population_size = population_size
+    ca.elite_size = elite_size
+    topological_order = ca._topological_sort()
+    ca._build_layout(topological_order)
+    evaluate = ca._evaluator()
+    
+    population = [ca._create_smart_chromosome(topological_order) for _ in range(population_size)]
+    for generation in range(generations):
+        fitnesses = [evaluate(chromosome) for chromosome in population]
+        
+        if generation and generation % MIGRATION_INTERVAL == 0:
+            ranked = sorted(range(len(population)), key=lambda i: fitnesses[i])
+            outbox.put([(fitnesses[i], population[i]) for i in ranked[:MIGRANTS]])
+            incoming = []
+            while not inbox.empty():
+                incoming.extend(inbox.get_nowait())
+            incoming.sort(key=lambda x: x[0])
+            for i, (fitness, chromosome) in zip(reversed(ranked), incoming[:MIGRANTS]):
+                population[i], fitnesses[i] = chromosome, fitness
+        
+        population = ca._next_generation(population, fitnesses, topological_order)
+    
+    return ca.belief_space.global_best_fitness, ca.belief_space.global_best_chromosome, ca.history
+
+# ============================================================================
+# BACKTRACKING PLACEMENT
+# ============================================================================
+
+@njit(cache=True, nogil=True)
+def _place(order, durations, child_indptr, child_nodes, num_machines, max_chunk):
+    """Giffler-Thompson active schedule of every job's chunks.
+
+    Jobs are given by index; order is a topological sequence and the
+    children of job j are child_nodes[child_indptr[j]:child_indptr[j + 1]].
+    Jobs longer than max_chunk are split evenly into ceil(duration / max_chunk)
+    sequential chunks. Each step takes the least-loaded machine m* (lowest
+    index on ties), finds the earliest completion C* among the next chunks of
+    all ready jobs on it, and from the conflict set (chunks that could start
+    before C*) schedules the one with the longest remaining critical path,
+    earlier topological position breaking ties. Returns machine_times plus
+    per-chunk machine, start, end, size, owning job index and 1-based chunk
+    index, all in placement order.
+    """
+    num_jobs = order.shape[0]
+    num_chunks = 0
+    chunks_of = np.empty(durations.shape[0], np.int64)
+    for t in range(num_jobs):
+        j = order[t]
+        d = durations[j]
+        chunks_of[j] = (d + max_chunk - 1) // max_chunk if d > max_chunk else 1
+        num_chunks += chunks_of[j]
+    
+    # Priority: job duration plus the longest successor chain, built in
+    # reverse topological order; rank is the tie-break
+    tail = np.zeros(durations.shape[0], np.int64)
+    rank = np.empty(durations.shape[0], np.int64)
+    in_degree = np.zeros(durations.shape[0], np.int64)
+    for t in range(num_jobs - 1, -1, -1):
+        j = order[t]
+        rank[j] = t
+        longest = 0
+        for c in range(child_indptr[j], child_indptr[j + 1]):
+            child = child_nodes[c]
+            in_degree[child] += 1
+            if tail[child] > longest:
+                longest = tail[child]
+        tail[j] = durations[j] + longest
+    
+    machine_times = np.zeros(num_machines, np.int64)
+    # Min-heap of (free time, machine): the root is the least-loaded machine,
+    # lowest index on ties
+    free_heap = [(np.int64(0), np.int64(m)) for m in range(num_machines)]
+    heapq.heapify(free_heap)
+    earliest = np.zeros(durations.shape[0], np.int64)  # ready time of the job's next chunk
+    done = np.zeros(durations.shape[0], np.int64)  # chunks already placed
+    placed = np.zeros(durations.shape[0], np.int64)  # work already placed
+    ready = np.empty(num_jobs, np.int64)
+    num_ready = 0
+    for t in range(num_jobs):
+        if in_degree[order[t]] == 0:
+            ready[num_ready] = order[t]
+            num_ready += 1
+    
+    chunk_mach = np.empty(num_chunks, np.int64)
+    chunk_start = np.empty(num_chunks, np.int64)
+    chunk_end = np.empty(num_chunks, np.int64)
+    chunk_size = np.empty(num_chunks, np.int64)
+    chunk_owner = np.empty(num_chunks, np.int64)
+    chunk_idx = np.empty(num_chunks, np.int64)
+    
+    for k in range(num_chunks):
+        free_at, machine = heapq.heappop(free_heap)
+        
+        # C*: earliest completion of any ready chunk on m*
+        best_end = np.iinfo(np.int64).max
+        for r in range(num_ready):
+            j = ready[r]
+            i = done[j]
+            size = durations[j] // chunks_of[j] + (1 if i < durations[j] % chunks_of[j] else 0)
+            begin = earliest[j] if earliest[j] > free_at else free_at
+            if begin + size < best_end:
+                best_end = begin + size
+        
+        # Conflict set: ready chunks starting before C*, plus the chunk that
+        # attains C* (a zero-size chunk starts exactly at C*); take the
+        # highest priority
+        pick = -1
+        for r in range(num_ready):
+            j = ready[r]
+            i = done[j]
+            size = durations[j] // chunks_of[j] + (1 if i < durations[j] % chunks_of[j] else 0)
+            begin = earliest[j] if earliest[j] > free_at else free_at
+            if begin >= best_end and begin + size != best_end:
+                continue
+            if pick < 0:
+                pick = r
+                continue
+            p = ready[pick]
+            remaining_j = tail[j] - placed[j]
+            remaining_p = tail[p] - placed[p]
+            if remaining_j > remaining_p or (remaining_j == remaining_p and rank[j] < rank[p]):
+                pick = r
+        assert pick >= 0, "empty conflict set"
+        
+        j = ready[pick]
+        i = done[j]
+        size = durations[j] // chunks_of[j] + (1 if i < durations[j] % chunks_of[j] else 0)
+        begin = earliest[j] if earliest[j] > free_at else free_at
+        end = begin + size
+        
+        chunk_mach[k] = machine
+        chunk_start[k] = begin
+        chunk_end[k] = end
+        chunk_size[k] = size
+        chunk_owner[k] = j
+        chunk_idx[k] = i + 1
+        machine_times[machine] = end
+        heapq.heappush(free_heap, (end, machine))
+        earliest[j] = end
+        done[j] = i + 1
+        placed[j] += size
+        
+        if done[j] == chunks_of[j]:
+            # Job finished: drop it from the ready set and release successors
+            num_ready -= 1
+            ready[pick] = ready[num_ready]
+            for c in range(child_indptr[j], child_indptr[j + 1]):
+                child = child_nodes[c]
+                if end > earliest[child]:
+                    earliest[child] = end
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    ready[num_ready] = child
+                    num_ready += 1
+    
+    return machine_times, chunk_mach, chunk_start, chunk_end, chunk_size, chunk_owner, chunk_idx
+
+def _init_placement():
+    """Load (or compile) _place() before the first backtracking request."""
+    i64 = np.zeros(1, np.int64)
+    _place(i64, i64, np.zeros(2, np.int64), np.zeros(0, np.int64), 1, 1)
+
 # ============================================================================
 # BACKTRACKING SOLVER - WITH STRICT CAPACITY LIMITS
 # ============================================================================
 
+# Backtracking log messages are recorded as (code, args) and only formatted
+# when the result is built
+(_L_START, _L_JOBS, _L_WORK, _L_CAPACITY, _L_CAP_ERROR, _L_OVER_TOTAL, _L_SPLIT_PLAN,
+ _L_PROCESSING, _L_NEEDS_SPLIT, _L_CHUNK_SIZES, _L_CAP_WARNING, _L_CHUNK, _L_NO_SPLIT,
+ _L_ANALYSIS, _L_MACHINE, _L_M_WORK, _L_M_UTIL, _L_M_CAPACITY, _L_M_USAGE, _L_M_TASKS,
+ _L_M_EXCEEDED, _L_M_TASK, _L_VIOLATIONS, _L_V_JOB, _L_V_MACHINE, _L_V_EXCEEDED) = range(26)
+
+_LOG_FORMATS = (
+    "🔍 Starting Backtracking Algorithm...",
+    "📊 Total jobs: %s",
+    "📊 Total work: %s units",
+    "🏭 Machine Capacity: %s units per machine (FIXED)",
+    "❌ CAPACITY ERROR: Job '%s' (%s units) exceeds 40-unit limit",
+    "⚠️ WARNING: Total work exceeds total capacity (%s units)",
+    "📦 %s (%s) → %s chunks",
+    "\n📝 Processing: %s (Duration: %s)",
+    "   Needs splitting into %s chunks",
+    "   Chunk sizes: %s",
+    "   ⚠️ Capacity warning on Machine %s",
+    "   %s chunk %s: Size=%s, Machine=%s, Start=%s, End=%s",
+    "   No splitting needed. Machine=%s, Start=%s, End=%s",
+    "\n📈 ===== SCHEDULE ANALYSIS =====",
+    "\nMachine %s:",
+    "  Total work: %s",
+    "  Utilization: %.1f%%",
+    "  Capacity: %s units",
+    "  Capacity usage: %.1f%%",
+    "  Tasks: %s",
+    "  ⚠️ WARNING: Exceeded capacity by %.1f units",
+    "    %s: %s-%s (%s units)",
+    "\n⚠️ ===== CAPACITY VIOLATIONS =====",
+    "  ⚠️ Job %s (ID: %s)",
+    "    Machine %s: %s-%s",
+    "    Exceeded capacity by %.1f units",
+)
+
 class BacktrackingSolver:
     def __init__(self, jobs: List[Job], machine_capacity: int = 40):
         self.jobs = jobs
@@ -603,231 +1059,241 @@ class BacktrackingSolver:
         self.best_makespan = float('inf')
         self.best_schedule = None
         self.iterations = 0
-        self.logs = []
+        self.log_entries = []  # (code, args) pairs, see _LOG_FORMATS
         self.start_time = time.time()
-        self.total_work = sum(job.duration for job in jobs)
+        self.durations = np.fromiter((job.duration for job in jobs), dtype=np.int64, count=len(jobs))
+        self.total_work = int(self.durations.sum())
         self.MAX_CHUNK_SIZE = MAX_CHUNK_SIZE
         self.capacity_violations = []
         self.has_capacity_error = False
+        self.verbose = False  # per-job / per-chunk placement logs
+        
+        # Dense job indices and the dep -> job adjacency, built once and
+        # shared by the topological sort and the placement kernel. Unknown
+        # dependency ids are ignored
+        self._id_to_idx = {job.id: idx for idx, job in enumerate(jobs)}
+        self._children = [[] for _ in jobs]
+        for idx, job in enumerate(jobs):
+            for dep_id in job.dependencies:
+                dep_idx = self._id_to_idx.get(dep_id)
+                if dep_idx is not None:
+                    self._children[dep_idx].append(idx)
 
     def solve(self):
-        self.logs.append("🔍 Starting Backtracking Algorithm...")
-        self.logs.append(f"📊 Total jobs: {len(self.jobs)}")
-        self.logs.append(f"📊 Total work: {self.total_work} units")
-        self.logs.append(f"🏭 Machine Capacity: {self.machine_capacity} units per machine (FIXED)")
+        log = self.log_entries.append
+        verbose = self.verbose
+        n_machines = self.num_machines
+        cap = self.machine_capacity
+        max_chunk = self.MAX_CHUNK_SIZE
+        viols = self.capacity_violations
+        log((_L_START, ()))
+        log((_L_JOBS, (len(self.jobs),)))
+        log((_L_WORK, (self.total_work,)))
+        log((_L_CAPACITY, (cap,)))
         
         # STRICT CAPACITY CHECK: Reject if any job exceeds 40
-        for job in self.jobs:
-            if job.duration > self.machine_capacity:
-                self.has_capacity_error = True
-                self.logs.append(f"❌ CAPACITY ERROR: Job '{job.name}' ({job.duration} units) exceeds 40-unit limit")
-                return self._create_capacity_error_result(
-                    f"Job '{job.name}' ({job.duration} units) exceeds the 40-unit machine capacity limit"
-                )
+        too_long = np.flatnonzero(self.durations > cap)
+        if too_long.size:
+            job = self.jobs[int(too_long[0])]
+            self.has_capacity_error = True
+            log((_L_CAP_ERROR, (job.name, job.duration)))
+            return self._create_capacity_error_result(
+                f"Job '{job.name}' ({job.duration} units) exceeds the 40-unit machine capacity limit"
+            )
         
         # Check total capacity
         if self.total_work > TOTAL_CAPACITY:
-            self.logs.append(f"⚠️ WARNING: Total work exceeds total capacity ({TOTAL_CAPACITY} units)")
+            log((_L_OVER_TOTAL, (TOTAL_CAPACITY,)))
         
-        for job in self.jobs:
-            if job.duration > self.MAX_CHUNK_SIZE:
-                chunks_needed = (job.duration + self.MAX_CHUNK_SIZE - 1) // self.MAX_CHUNK_SIZE
-                self.logs.append(f"📦 {job.name} ({job.duration}) → {chunks_needed} chunks")
+        for idx in np.flatnonzero(self.durations > max_chunk).tolist():
+            job = self.jobs[idx]
+            chunks_needed = (job.duration + max_chunk - 1) // max_chunk
+            log((_L_SPLIT_PLAN, (job.name, job.duration, chunks_needed)))
         
         topological = self._topological_sort()
         if not topological:
             return self._create_error_result("Cycle Detected")
         
-        machine_times = [0, 0, 0]
-        machine_schedules = [[] for _ in range(3)]
-        
-        for job in topological:
-            self.logs.append(f"\n📝 Processing: {job.name} (Duration: {job.duration})")
-            
-            earliest_start = 0
-            for dep_id in job.dependencies:
-                for m_sched in machine_schedules:
-                    for dep_job, _, dep_end, _ in m_sched:
-                        if dep_job.id == dep_id:
-                            earliest_start = max(earliest_start, dep_end)
-            
-            if job.duration > self.MAX_CHUNK_SIZE:
-                chunks_needed = (job.duration + self.MAX_CHUNK_SIZE - 1) // self.MAX_CHUNK_SIZE
-                self.logs.append(f"   Needs splitting into {chunks_needed} chunks")
-                
-                base = job.duration // chunks_needed
-                remainder = job.duration % chunks_needed
-                
-                chunk_sizes = []
-                for i in range(chunks_needed):
-                    if i < remainder:
-                        chunk_sizes.append(base + 1)
-                    else:
-                        chunk_sizes.append(base)
-                
-                final_sizes = []
-                for size in chunk_sizes:
-                    if size > self.MAX_CHUNK_SIZE:
-                        sub_chunks = (size + self.MAX_CHUNK_SIZE - 1) // self.MAX_CHUNK_SIZE
-                        sub_base = size // sub_chunks
-                        sub_rem = size % sub_chunks
-                        
-                        for j in range(sub_chunks):
-                            if j < sub_rem:
-                                final_sizes.append(sub_base + 1)
-                            else:
-                                final_sizes.append(sub_base)
-                    else:
-                        final_sizes.append(size)
-                
-                self.logs.append(f"   Chunk sizes: {final_sizes}")
-                
-                current_time = earliest_start
-                
-                for i, chunk_size in enumerate(final_sizes):
-                    min_machine = min(range(self.num_machines), key=lambda m: machine_times[m])
-                    start_time = max(current_time, machine_times[min_machine])
-                    end_time = start_time + chunk_size
-                    
-                    # Check capacity (for visualization only)
-                    if end_time > self.machine_capacity:
-                        self.capacity_violations.append({
-                            'job_id': job.id,
-                            'job_name': job.name,
-                            'machine': min_machine,
-                            'chunk_size': chunk_size,
-                            'exceeded_by': end_time - self.machine_capacity,
-                            'start': start_time,
-                            'end': end_time
-                        })
-                        self.logs.append(f"   ⚠️ Capacity warning on Machine {min_machine+1}")
-                    
-                    machine_times[min_machine] = end_time
-                    machine_schedules[min_machine].append((job, start_time, end_time, chunk_size))
-                    
-                    self.logs.append(f"   Chunk {i+1}: Size={chunk_size}, Machine={min_machine+1}, Start={start_time}, End={end_time}")
-                    current_time = end_time
-            
-            else:
-                min_machine = min(range(self.num_machines), key=lambda m: machine_times[m])
-                start_time = max(earliest_start, machine_times[min_machine])
-                end_time = start_time + job.duration
-                
-                # Check capacity (for visualization only)
-                if end_time > self.machine_capacity:
-                    self.capacity_violations.append({
-                        'job_id': job.id,
-                        'job_name': job.name,
-                        'machine': min_machine,
-                        'chunk_size': job.duration,
-                        'exceeded_by': end_time - self.machine_capacity,
-                        'start': start_time,
-                        'end': end_time
-                    })
-                    self.logs.append(f"   ⚠️ Capacity warning on Machine {min_machine+1}")
-                
-                machine_times[min_machine] = end_time
-                machine_schedules[min_machine].append((job, start_time, end_time, job.duration))
-                
-                self.logs.append(f"   No splitting needed. Machine={min_machine+1}, Start={start_time}, End={end_time}")
+        # Placement runs in the _place kernel over job indices; the children
+        # lists become a CSR pair for it
+        jobs = self.jobs
+        children = self._children
+        order = np.array(self._order, dtype=np.int64)
+        child_indptr = np.zeros(len(jobs) + 1, dtype=np.int64)
+        child_indptr[1:] = np.cumsum([len(kids) for kids in children])
+        child_nodes = np.array([kid for kids in children for kid in kids], dtype=np.int64)
+        
+        machine_times, chunk_mach, chunk_start, chunk_end, chunk_size, chunk_owner, chunk_idx = _place(
+            order, self.durations, child_indptr, child_nodes, n_machines, max_chunk)
+        
+        job_ids = np.array([job.id for job in jobs], dtype=np.int64)
+        chunk_counts = np.bincount(chunk_owner, minlength=len(jobs))
+        chunk_totals = dict(zip(job_ids.tolist(), chunk_counts.tolist()))  # job id -> number of chunks
+        
+        # Capacity check (for visualization only), in placement order
+        over = chunk_end > cap
+        for k in np.flatnonzero(over).tolist():
+            job = jobs[chunk_owner[k]]
+            viols.append({
+                'job_id': job.id,
+                'job_name': job.name,
+                'machine': int(chunk_mach[k]),
+                'chunk_size': int(chunk_size[k]),
+                'exceeded_by': int(chunk_end[k]) - cap,
+                'start': int(chunk_start[k]),
+                'end': int(chunk_end[k])
+            })
         
-        makespan = max(machine_times)
+        # Replay the placement into the log. Chunks of different jobs
+        # interleave, so a job's header is logged at its first chunk
+        if verbose:
+            for k, (j, i, machine, start_time, end_time, size) in enumerate(zip(
+                    chunk_owner.tolist(), chunk_idx.tolist(), chunk_mach.tolist(),
+                    chunk_start.tolist(), chunk_end.tolist(), chunk_size.tolist())):
+                job = jobs[j]
+                n_chunks = int(chunk_counts[j])
+                if i == 1:
+                    log((_L_PROCESSING, (job.name, job.duration)))
+                    if n_chunks > 1:
+                        log((_L_NEEDS_SPLIT, (n_chunks,)))
+                        log((_L_CHUNK_SIZES, (chunk_size[chunk_owner == j].tolist(),)))
+                if over[k]:
+                    log((_L_CAP_WARNING, (machine + 1,)))
+                if n_chunks > 1:
+                    log((_L_CHUNK, (job.name, i, size, machine + 1, start_time, end_time)))
+                else:
+                    log((_L_NO_SPLIT, (machine + 1, start_time, end_time)))
+        else:
+            for violation in viols:
+                log((_L_CAP_WARNING, (violation['machine'] + 1,)))
+        
+        # Per-machine parallel columns; jids index back into self.job_dict.
+        # Boolean selection keeps placement order, i.e. start order per machine
+        starts, ends, sizes, jids, cids = [], [], [], [], []
+        for machine_id in range(n_machines):
+            on_machine = chunk_mach == machine_id
+            starts.append(chunk_start[on_machine])
+            ends.append(chunk_end[on_machine])
+            sizes.append(chunk_size[on_machine])
+            jids.append(job_ids[chunk_owner[on_machine]].tolist())
+            cids.append(chunk_idx[on_machine].tolist())  # 1-based chunk index within the job
+        
+        makespan = int(machine_times.max())
         self.best_makespan = makespan
-        self.best_schedule = {'schedules': machine_schedules}
-        
-        self._analyze_schedule(machine_schedules, makespan)
+        self.best_schedule = {
+            'starts': starts,
+            'ends': ends,
+            'sizes': sizes,
+            'jids': jids,
+            'cids': cids,
+            'totals': chunk_totals,
+        }
+        self.best_schedule['work'] = np.array([col.sum() for col in self.best_schedule['sizes']], dtype=np.int64)
+        
+        self._analyze_schedule(self.best_schedule, makespan)
         
         exec_time = time.time() - self.start_time
         eff, idle, tm, machine_loads = self._calc_stats()
         
         return ScheduleResult(
             success=True, makespan=makespan, execution_time=exec_time,
-            schedule=self._build_final(), logs=self.logs, splits_info=self._calc_splits(),
+            schedule=self._build_final(), logs=self._render_logs(), splits_info=self._calc_splits(),
             efficiency=eff, total_work=self.total_work, total_idle_time=idle,
             total_machine_time=tm, iterations=self.iterations,
-            capacity_violations=self.capacity_violations,
+            capacity_violations=viols,
             machine_loads=machine_loads
         )
 
     def _analyze_schedule(self, schedules, makespan):
-        self.logs.append("\n📈 ===== SCHEDULE ANALYSIS =====")
-        
-        for machine_id, machine_schedule in enumerate(schedules):
-            total_work = sum(size for _, _, _, size in machine_schedule)
-            utilization = (total_work / makespan * 100) if makespan > 0 else 0
+        log = self.log_entries.append
+        cap = self.machine_capacity
+        job_dict = self.job_dict
+        viols = self.capacity_violations
+        log((_L_ANALYSIS, ()))
+        
+        # All three machines' aggregates in one pass each
+        work = schedules['work']
+        utilization = (work / makespan * 100) if makespan > 0 else np.zeros(self.num_machines)
+        usage = np.minimum(100, work / cap * 100)
+        exceeded = work - cap
+        
+        for machine_id in range(self.num_machines):
+            m_starts = schedules['starts'][machine_id]
+            m_ends = schedules['ends'][machine_id]
+            m_sizes = schedules['sizes'][machine_id]
+            m_jids = schedules['jids'][machine_id]
             
-            self.logs.append(f"\nMachine {machine_id + 1}:")
-            self.logs.append(f"  Total work: {total_work}")
-            self.logs.append(f"  Utilization: {utilization:.1f}%")
-            self.logs.append(f"  Capacity: {self.machine_capacity} units")
-            self.logs.append(f"  Capacity usage: {min(100, (total_work/self.machine_capacity)*100):.1f}%")
-            self.logs.append(f"  Tasks: {len(machine_schedule)}")
+            log((_L_MACHINE, (machine_id + 1,)))
+            log((_L_M_WORK, (int(work[machine_id]),)))
+            log((_L_M_UTIL, (utilization[machine_id],)))
+            log((_L_M_CAPACITY, (cap,)))
+            log((_L_M_USAGE, (usage[machine_id],)))
+            log((_L_M_TASKS, (len(m_jids),)))
             
-            if total_work > self.machine_capacity:
-                exceed = total_work - self.machine_capacity
-                self.logs.append(f"  ⚠️ WARNING: Exceeded capacity by {exceed:.1f} units")
+            if exceeded[machine_id] > 0:
+                log((_L_M_EXCEEDED, (exceeded[machine_id],)))
             
-            for job, start, end, size in machine_schedule:
-                self.logs.append(f"    {job.name}: {start}-{end} ({size} units)")
-        
-        if self.capacity_violations:
-            self.logs.append("\n⚠️ ===== CAPACITY VIOLATIONS =====")
-            for violation in self.capacity_violations:
-                self.logs.append(f"  ⚠️ Job {violation['job_name']} (ID: {violation['job_id']})")
-                self.logs.append(f"    Machine {violation['machine'] + 1}: {violation['start']}-{violation['end']}")
-                self.logs.append(f"    Exceeded capacity by {violation['exceeded_by']:.1f} units")
+            if self.verbose:
+                for job_id, start, end, size in zip(m_jids, m_starts.tolist(), m_ends.tolist(), m_sizes.tolist()):
+                    log((_L_M_TASK, (job_dict[job_id].name, start, end, size)))
+        
+        if viols:
+            log((_L_VIOLATIONS, ()))
+            for violation in viols:
+                log((_L_V_JOB, (violation['job_name'], violation['job_id'])))
+                log((_L_V_MACHINE, (violation['machine'] + 1, violation['start'], violation['end'])))
+                log((_L_V_EXCEEDED, (violation['exceeded_by'],)))
+    
+    def _render_logs(self):
+        """Format the deferred log entries into the strings the API returns."""
+        return [_LOG_FORMATS[code] % args for code, args in self.log_entries]
 
     def _topological_sort(self):
-        visited = set()
-        temp = set()
-        result = []
-        
-        def dfs(job_id):
-            if job_id in temp:
-                return False
-            if job_id in visited:
-                return True
-            
-            temp.add(job_id)
-            job = self.job_dict.get(job_id)
-            
-            if job:
-                for dep_id in job.dependencies:
-                    if not dfs(dep_id):
-                        return False
-            
-            temp.remove(job_id)
-            visited.add(job_id)
-            result.append(self.job_dict[job_id])
-            return True
-        
-        for job in self.jobs:
-            if job.id not in visited:
-                if not dfs(job.id):
-                    return None
-        
-        return result
+        # Kahn's algorithm over job indices: edges run dep -> job, so a job's
+        # in-degree is its number of (known) dependencies
+        jobs = self.jobs
+        children = self._children
+        in_degree = [0] * len(jobs)
+        for kids in children:
+            for child in kids:
+                in_degree[child] += 1
+        
+        # Walk the DAG one layer of ready jobs at a time, longest-first (LPT)
+        # within a layer; _place uses this position to break priority ties
+        layer = [idx for idx, degree in enumerate(in_degree) if degree == 0]
+        order = []
+        while layer:
+            layer.sort(key=lambda idx: jobs[idx].duration, reverse=True)
+            next_layer = []
+            for idx in layer:
+                order.append(idx)
+                for child in children[idx]:
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        next_layer.append(child)
+            layer = next_layer
+        
+        if len(order) != len(jobs):
+            return None
+        self._order = order
+        return [jobs[idx] for idx in order]
 
     def _calc_stats(self):
         if not self.best_schedule:
             return 0, 0, 0, [0, 0, 0]
         
+        cap = self.machine_capacity
         total_machine_time = self.best_makespan * 3
-        total_work_time = 0
-        machine_work = [0] * 3
-        
-        for machine_id, machine_schedule in enumerate(self.best_schedule['schedules']):
-            for job, start, end, size in machine_schedule:
-                total_work_time += size
-                machine_work[machine_id] += size
+        machine_work = self.best_schedule['work']
+        total_work_time = int(machine_work.sum())
         
         efficiency = (total_work_time / total_machine_time * 100) if total_machine_time > 0 else 0
         idle_time = total_machine_time - total_work_time
         
-        machine_loads = []
-        for work in machine_work:
-            load_pct = (work / self.machine_capacity * 100) if self.machine_capacity > 0 else 0
-            machine_loads.append(load_pct)
+        if cap > 0:
+            machine_loads = (machine_work / cap * 100).tolist()
+        else:
+            machine_loads = [0, 0, 0]
         
         return efficiency, idle_time, total_machine_time, machine_loads
 
@@ -836,42 +1302,39 @@ class BacktrackingSolver:
             return {}
         
         splits = {}
-        for machine_schedule in self.best_schedule['schedules']:
-            for job, _, _, _ in machine_schedule:
-                splits[job.id] = splits.get(job.id, 0) + 1
+        for m_jids in self.best_schedule['jids']:
+            for job_id in m_jids:
+                splits[job_id] = splits.get(job_id, 0) + 1
         return splits
 
     def _build_final(self):
         if not self.best_schedule:
-            return [[] for _ in range(3)]
+            return [[] for _ in range(self.num_machines)]
         
-        final = [[] for _ in range(3)]
-        job_chunks = {}
-        
-        for machine_id, machine_schedule in enumerate(self.best_schedule['schedules']):
-            for job, start, end, size in machine_schedule:
-                if job.id not in job_chunks:
-                    job_chunks[job.id] = []
-                job_chunks[job.id].append((machine_id, start, end, job, size))
+        final = [[] for _ in range(self.num_machines)]
         
-        for job_id, chunks in job_chunks.items():
-            chunks.sort(key=lambda x: x[1])
-            total = len(chunks)
-            
-            for idx, (machine_id, start, end, job, size) in enumerate(chunks):
-                final[machine_id].append(TaskChunk(
-                    job=job,
+        # Placement appends in start order per machine and numbers chunks as
+        # it goes, so no regrouping or sorting is needed here
+        schedule = self.best_schedule
+        job_dict = self.job_dict
+        totals = schedule['totals']
+        for machine_id in range(self.num_machines):
+            append = final[machine_id].append
+            for job_id, start, end, size, chunk_id in zip(schedule['jids'][machine_id],
+                                                          schedule['starts'][machine_id].tolist(),
+                                                          schedule['ends'][machine_id].tolist(),
+                                                          schedule['sizes'][machine_id].tolist(),
+                                                          schedule['cids'][machine_id]):
+                append(TaskChunk(
+                    job=job_dict[job_id],
                     machine=machine_id,
                     start=start,
                     end=end,
-                    chunk_id=idx + 1,
-                    total_chunks=total,
+                    chunk_id=chunk_id,
+                    total_chunks=totals[job_id],
                     size=size
                 ))
         
-        for machine_schedule in final:
-            machine_schedule.sort(key=lambda x: x.start)
-        
         return final
 
     def _create_error_result(self, msg):
@@ -897,18 +1360,68 @@ class BacktrackingSolver:
 # API ENDPOINTS
 # ============================================================================
 
+# Results of identical DAGs, keyed by _request_key(); only touched from the
+# event loop thread
+_result_cache: "OrderedDict[bytes, ScheduleResult]" = OrderedDict()
+
+def _request_key(request: ScheduleRequest) -> bytes:
+    """Content hash of a request: the same DAG gives the same key whatever
+    the order of its jobs and dependency lists."""
+    algorithm = "backtracking" if request.algorithm == "backtracking" else "cultural"
+    jobs = sorted(
+        (job.id, job.name, job.duration, tuple(sorted(job.dependencies)), job.min_chunk_size)
+        for job in request.jobs
+    )
+    return hashlib.blake2b(pickle.dumps((algorithm, jobs)), digest_size=16).digest()
+
+def _replace_broken_pool(broken):
+    """Replace app.state.pool after it broke. Runs on the event loop, so
+    concurrent requests that hit the same broken pool replace it only once."""
+    if app.state.pool is broken:
+        broken.shutdown(wait=False, cancel_futures=True)
+        app.state.pool = ProcessPoolExecutor(max_workers=app.state.pool_size, initializer=_init_worker)
+
 @app.post("/api/solve")
 async def solve_schedule(request: ScheduleRequest):
     try:
         # Always use 40 as capacity
         machine_capacity = 40
         
+        start_time = time.time()
+        key = _request_key(request)
+        cached = _result_cache.get(key)
+        if cached is not None:
+            _result_cache.move_to_end(key)
+            # execution_time reports this request, not the original solve
+            return cached.model_copy(update={"execution_time": time.time() - start_time}, deep=True)
+        
+        # Solvers are CPU-bound and synchronous: run them in the default
+        # threadpool so the event loop keeps serving other requests
+        loop = asyncio.get_running_loop()
+        
         if request.algorithm == "backtracking":
             solver = BacktrackingSolver(request.jobs, machine_capacity)
+            result = await loop.run_in_executor(None, solver.solve)
         else:
+            pool = app.state.pool
             solver = CulturalAlgorithm(request.jobs, machine_capacity)
-        
-        return solver.solve()
+            try:
+                result = await loop.run_in_executor(
+                    None, partial(solver.solve, pool, app.state.pool_size, app.state.rings))
+            except BrokenProcessPool:
+                # A worker died (OOM, kill): swap in a fresh pool and retry once
+                _replace_broken_pool(pool)
+                solver = CulturalAlgorithm(request.jobs, machine_capacity)
+                result = await loop.run_in_executor(
+                    None, partial(solver.solve, app.state.pool, app.state.pool_size, app.state.rings))
+            if result.success:
+                # Render the convergence plot off the event loop
+                result.performance_plot = await loop.run_in_executor(None, solver._generate_plot)
+        
+        _result_cache[key] = result.model_copy(deep=True)
+        if len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+        return result
         
     except Exception as e:
         import traceback
@@ -930,4 +1443,10 @@ if __name__ == "__main__":
     print("🚫 Tasks > 40 units will be REJECTED")
     print("⛓️ Sequential chunk execution")
     print("📌 Tasks > 5 split into sequential chunks")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # One server process per core; uvicorn picks uvloop/httptools when they
+    # are installed. Workers inherit WEB_CONCURRENCY to size their pools, so
+    # each gets cpu_count // N evaluation processes and the Cultural
+    # Algorithm evaluates in-process when that leaves it a single one
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=workers)
\ No newline at end of file
@@ -0,0 +1,21 @@
+from main import BacktrackingSolver, Job
+
+
+def test_backtracking_zero_duration_job():
+    jobs = [
+        Job(id=1, name="a", duration=3),
+        Job(id=2, name="b", duration=0, dependencies=[1]),
+        Job(id=3, name="c", duration=4, dependencies=[2]),
+    ]
+    result = BacktrackingSolver(jobs).solve()
+
+    assert result.success
+    chunks = {}
+    for machine in result.schedule:
+        for chunk in machine:
+            chunks.setdefault(chunk.job.id, []).append(chunk)
+    assert sorted(chunks) == [1, 2, 3]
+    assert [c.size for c in chunks[2]] == [0]
+    assert chunks[2][0].start >= chunks[1][-1].end
+    assert chunks[3][0].start >= chunks[2][-1].end
+    assert result.makespan == 7